@@ -18,6 +18,8 @@ logger = logging.getLogger("main")
 ## DB models
 class AuthenticationMethod(TimestampedModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
+    ## 255 is the max length of an OIDC sub claim and fits password hashes,
+    ## narrowing it does not shrink rows or index entries on Postgres (varlena)
     auth_id = models.CharField(max_length=255, unique=True)
 
     class Meta:
@@ -40,6 +42,7 @@ class AuthenticationMethod(TimestampedModel):
 
 class CustomProfileAuthenticationMethod(AuthenticationMethod):
     email = models.EmailField(unique=True)
+    ## provider image urls (esp. signed Facebook CDN urls) can exceed 255 chars
     profile_image = models.URLField(max_length=500, blank=True)
 
     class Meta:
@@ -0,0 +1,28 @@
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+from .models import Role
+
+## keys include the response etag, so a changed row yields a new key
+## instead of needing to delete the old one
+RESPONSE_CACHE_TIMEOUT = 300
+
+
+def get_my_courses_cache_key(user_id: int, etag: str) -> str:
+    return f"mycourses:v2:{user_id}:{etag}"
+
+
+def get_course_milestones_cache_key(course_id: int, role: Role, etag: str) -> str:
+    return f"milestones:v2:{course_id}:{role}:{etag}"
+
+
+def get_or_build_cached_data(key: str, builder: Callable[[], Any]) -> Any:
+    ## cache the data before rendering so that responses still go through the camel case renderer
+    data = cache.get(key)
+
+    if data is None:
+        data = builder()
+        cache.set(key, data, RESPONSE_CACHE_TIMEOUT)
+
+    return data
@@ -1,10 +1,19 @@
 import logging
-from typing import Optional, Sequence
+from typing import Iterable, Iterator, Optional, Sequence
 from datetime import datetime
 
-from django.utils.timezone import get_default_timezone
-
-from django.db.models import QuerySet, Prefetch
+from django.utils.timezone import get_default_timezone, now as timezone_now
+
+from django.db.models import (
+    Count,
+    Exists,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Prefetch,
+    prefetch_related_objects,
+)
 from django.db import IntegrityError, transaction
 
 from pigeonhole.common.constants import (
@@ -42,11 +51,24 @@ from pigeonhole.common.constants import (
     CONTENT,
     IS_DELETED,
     VISIBILITY,
+    CREATED_AT,
+    UPDATED_AT,
+)
+from pigeonhole.common.responses import make_etag
+from pigeonhole.common.parsers import (
+    to_base_json,
+    ms_timestamp_expression,
+    parse_datetime_to_ms_timestamp,
 )
-from pigeonhole.common.parsers import to_base_json, parse_datetime_to_ms_timestamp
 from forms.models import Form
 from users.models import User
-from users.logic import user_to_json, get_users
+from users.logic import (
+    cached_user_to_json,
+    get_user_row_to_json_annotations,
+    get_user_row_to_json_values,
+    get_users,
+    user_row_to_json,
+)
 
 from .models import (
     Comment,
@@ -60,6 +82,7 @@ from .models import (
     CourseSubmission,
     CourseSubmissionComment,
     CourseSubmissionViewableGroup,
+    CourseSubmissionViewableMember,
     PatchCourseGroupAction,
     Role,
     SubmissionType,
@@ -70,7 +93,25 @@ logger = logging.getLogger("main")
 
 
 def get_courses(*args, **kwargs) -> QuerySet[Course]:
-    return Course.objects.filter(*args, **kwargs)
+    ## owner and course settings are always serialized together with the course,
+    ## so all courses passed to course_to_json should be fetched from here.
+    ## image_id is the only selected column that is never serialized.
+    return (
+        Course.objects.select_related("owner__profile_image", "coursesettings")
+        .defer("owner__profile_image__image_id")
+        .filter(*args, **kwargs)
+    )
+
+
+def get_course_memberships_with_course(*args, **kwargs) -> QuerySet[CourseMembership]:
+    ## same related rows as get_courses, reached through the membership
+    return (
+        CourseMembership.objects.select_related(
+            "course__owner__profile_image", "course__coursesettings"
+        )
+        .defer("course__owner__profile_image__image_id")
+        .filter(*args, **kwargs)
+    )
 
 
 def get_requested_course_submissions(
@@ -89,6 +130,11 @@ def get_requested_course_submissions(
         "template__form",
         "creator__user__profile_image",
         "editor__user__profile_image",
+    ).annotate(
+        ## read by get_course_submission_visibility instead of a count per submission
+        has_viewable_groups=Exists(
+            CourseSubmissionViewableGroup.objects.filter(submission=OuterRef("pk"))
+        )
     )
 
     if milestone_id is not None:
@@ -109,42 +155,252 @@ def get_requested_course_submissions(
     return submissions
 
 
+def get_course_milestones(course: Course) -> QuerySet[CourseMilestone]:
+    ## let the database compute the ms timestamps for list serialization
+    ## so the datetime columns themselves do not need to be loaded
+    return (
+        course.coursemilestone_set.annotate(
+            created_at_ms=ms_timestamp_expression("created_at"),
+            updated_at_ms=ms_timestamp_expression("updated_at"),
+            start_date_time_ms=ms_timestamp_expression("start_date_time"),
+            end_date_time_ms=ms_timestamp_expression("end_date_time"),
+        )
+        .only("name", "description", "is_published")
+        .order_by("start_date_time", "id")
+    )
+
+
+def get_course_memberships_json(course: Course) -> list[dict]:
+    ## same output as course_membership_to_json, built from projected columns
+    ## instead of membership, user and image model instances
+    rows = course.coursemembership_set.values(
+        "id", "role", *get_user_row_to_json_values("user")
+    ).annotate(
+        created_at_ms=ms_timestamp_expression("created_at"),
+        updated_at_ms=ms_timestamp_expression("updated_at"),
+        **get_user_row_to_json_annotations("user"),
+    )
+
+    return [
+        {
+            ID: row["id"],
+            CREATED_AT: row["created_at_ms"],
+            UPDATED_AT: row["updated_at_ms"],
+            USER: user_row_to_json(row, "user"),
+            ROLE: row["role"],
+        }
+        for row in rows
+    ]
+
+
+## the etags below combine the row count (catches deletions) with the latest
+## updated_at of every table the list response is serialized from
+
+
+def get_my_courses_etag(user: User) -> str:
+    aggregates = user.coursemembership_set.aggregate(
+        count=Count("id"),
+        membership_updated_at=Max("updated_at"),
+        course_updated_at=Max("course__updated_at"),
+        owner_updated_at=Max("course__owner__updated_at"),
+    )
+
+    return make_etag(*aggregates.values())
+
+
+def get_course_milestones_etag(course: Course, role: Role) -> str:
+    milestones = course.coursemilestone_set.all()
+
+    if role == Role.STUDENT:
+        milestones = milestones.filter(is_published=True)
+
+    aggregates = milestones.aggregate(
+        count=Count("id"), milestone_updated_at=Max("updated_at")
+    )
+
+    return make_etag(role == Role.STUDENT, *aggregates.values())
+
+
+def get_course_submission_field_comment_counts_etag(
+    submission: CourseSubmission,
+) -> str:
+    aggregates = submission.coursesubmissioncomment_set.aggregate(
+        count=Count("id"), comment_updated_at=Max("updated_at")
+    )
+
+    return make_etag(submission.form_response_data_len, *aggregates.values())
+
+
+def get_course_memberships_etag(course: Course) -> str:
+    aggregates = course.coursemembership_set.aggregate(
+        count=Count("id"),
+        membership_updated_at=Max("updated_at"),
+        user_updated_at=Max("user__updated_at"),
+    )
+
+    return make_etag(*aggregates.values())
+
+
+def get_course_submission_field_comments_json(
+    submission: CourseSubmission, field_index: int
+) -> list[dict]:
+    ## same output as course_submission_comment_to_json, built from projected columns
+    ## instead of submission comment, comment, user, image and membership instances
+    rows = (
+        submission.coursesubmissioncomment_set.filter(field_index=field_index)
+        .values(
+            "id",
+            "field_index",
+            "member__role",
+            "comment__content",
+            "comment__is_deleted",
+            *get_user_row_to_json_values("comment__commenter"),
+        )
+        .annotate(
+            created_at_ms=ms_timestamp_expression("comment__created_at"),
+            updated_at_ms=ms_timestamp_expression("comment__updated_at"),
+            **get_user_row_to_json_annotations("comment__commenter"),
+        )
+    )
+
+    return [
+        {
+            ID: row["id"],
+            CREATED_AT: row["created_at_ms"],
+            UPDATED_AT: row["updated_at_ms"],
+            COMMENTER: user_row_to_json(row, "comment__commenter"),
+            CONTENT: "" if row["comment__is_deleted"] else row["comment__content"],
+            IS_DELETED: row["comment__is_deleted"],
+            FIELD_INDEX: row["field_index"],
+            ROLE: row["member__role"],
+        }
+        for row in rows
+    ]
+
+
+def get_course_submission_viewable_groups(
+    submission: CourseSubmission,
+) -> QuerySet[CourseGroup]:
+    ## count the members in the same query instead of once per group
+    return CourseGroup.objects.filter(
+        coursesubmissionviewablegroup__submission=submission
+    ).annotate(member_count=Count("coursegroupmember"))
+
+
+def get_course_submission_viewable_groups_json(
+    submission: CourseSubmission,
+) -> list[dict]:
+    ## same output as course_group_to_json, built from projected columns
+    rows = (
+        get_course_submission_viewable_groups(submission)
+        .values("id", "name", "member_count")
+        .annotate(
+            created_at_ms=ms_timestamp_expression("created_at"),
+            updated_at_ms=ms_timestamp_expression("updated_at"),
+        )
+    )
+
+    return [
+        {
+            ID: row["id"],
+            CREATED_AT: row["created_at_ms"],
+            UPDATED_AT: row["updated_at_ms"],
+            NAME: row["name"],
+            MEMBER_COUNT: row["member_count"],
+        }
+        for row in rows
+    ]
+
+
 def get_course_submission_comments(
     submission: CourseSubmission,
 ) -> QuerySet[CourseSubmissionComment]:
+    ## reuse comments prefetched by iterate_course_submissions_with_comments
+    if "coursesubmissioncomment_set" in getattr(
+        submission, "_prefetched_objects_cache", {}
+    ):
+        return submission.coursesubmissioncomment_set.all()
+
     return submission.coursesubmissioncomment_set.select_related(
         "comment__commenter__profile_image", "member"
     )
 
 
-def course_summary_to_json(course: Course, membership: CourseMembership) -> dict:
+def iterate_course_submissions_with_comments(
+    submissions: QuerySet[CourseSubmission], chunk_size: int
+) -> Iterator[CourseSubmission]:
+    ## iterator() skips prefetch_related before Django 4.1, so prefetch each chunk here
+    comments_prefetch = Prefetch(
+        lookup="coursesubmissioncomment_set",
+        queryset=CourseSubmissionComment.objects.select_related(
+            "comment__commenter__profile_image", "member"
+        ),
+    )
+    chunk = []
+
+    for submission in submissions.iterator(chunk_size=chunk_size):
+        chunk.append(submission)
+
+        if len(chunk) == chunk_size:
+            prefetch_related_objects(chunk, comments_prefetch)
+            yield from chunk
+            chunk = []
+
+    prefetch_related_objects(chunk, comments_prefetch)
+    yield from chunk
+
+
+def course_summary_to_json(
+    course: Course,
+    membership: CourseMembership,
+    user_cache: Optional[dict[int, dict]] = None,
+) -> dict:
     data = to_base_json(course)
 
-    data |= {
-        NAME: course.name,
-        OWNER: user_to_json(course.owner),
-        DESCRIPTION: course.description,
-        IS_PUBLISHED: course.is_published,
-        ROLE: membership.role,
-    }
+    data[NAME] = course.name
+    data[OWNER] = cached_user_to_json(course.owner, user_cache)
+    data[DESCRIPTION] = course.description
+    data[IS_PUBLISHED] = course.is_published
+    data[ROLE] = membership.role
 
     return data
 
 
+def course_summaries_to_json(memberships: Iterable[CourseMembership]) -> list[dict]:
+    ## most courses in a list share the same few owners
+    user_cache = {}
+
+    return [
+        course_summary_to_json(
+            course=membership.course, membership=membership, user_cache=user_cache
+        )
+        for membership in memberships
+    ]
+
+
 def course_to_json(course: Course, membership: CourseMembership) -> dict:
+    ## courses should come from get_courses so that settings are not lazily loaded
     data = course_summary_to_json(course=course, membership=membership)
 
     course_settings: CourseSettings = course.coursesettings
-    data |= {
-        SHOW_GROUP_MEMBERS_NAMES: course_settings.show_group_members_names,
-        ALLOW_STUDENTS_TO_CREATE_GROUPS: course_settings.allow_students_to_create_groups,
-        ALLOW_STUDENTS_TO_DELETE_GROUPS: course_settings.allow_students_to_delete_groups,
-        ALLOW_STUDENTS_TO_JOIN_GROUPS: course_settings.allow_students_to_join_groups,
-        ALLOW_STUDENTS_TO_LEAVE_GROUPS: course_settings.allow_students_to_leave_groups,
-        ALLOW_STUDENTS_TO_MODIFY_GROUP_NAME: course_settings.allow_students_to_modify_group_name,
-        ALLOW_STUDENTS_TO_ADD_OR_REMOVE_GROUP_MEMBERS: course_settings.allow_students_to_add_or_remove_group_members,
-        MILESTONE_ALIAS: course_settings.milestone_alias,
-    }
+    data[SHOW_GROUP_MEMBERS_NAMES] = course_settings.show_group_members_names
+    data[
+        ALLOW_STUDENTS_TO_CREATE_GROUPS
+    ] = course_settings.allow_students_to_create_groups
+    data[
+        ALLOW_STUDENTS_TO_DELETE_GROUPS
+    ] = course_settings.allow_students_to_delete_groups
+    data[ALLOW_STUDENTS_TO_JOIN_GROUPS] = course_settings.allow_students_to_join_groups
+    data[
+        ALLOW_STUDENTS_TO_LEAVE_GROUPS
+    ] = course_settings.allow_students_to_leave_groups
+    data[
+        ALLOW_STUDENTS_TO_MODIFY_GROUP_NAME
+    ] = course_settings.allow_students_to_modify_group_name
+    data[
+        ALLOW_STUDENTS_TO_ADD_OR_REMOVE_GROUP_MEMBERS
+    ] = course_settings.allow_students_to_add_or_remove_group_members
+    data[MILESTONE_ALIAS] = course_settings.milestone_alias
 
     return data
 
@@ -152,22 +408,31 @@ def course_to_json(course: Course, membership: CourseMembership) -> dict:
 def course_milestone_to_json(milestone: CourseMilestone) -> dict:
     data = to_base_json(milestone)
 
-    data |= {
-        NAME: milestone.name,
-        DESCRIPTION: milestone.description,
-        START_DATE_TIME: parse_datetime_to_ms_timestamp(milestone.start_date_time),
-        END_DATE_TIME: parse_datetime_to_ms_timestamp(milestone.end_date_time),
-        IS_PUBLISHED: milestone.is_published,
-    }
+    data[NAME] = milestone.name
+    data[DESCRIPTION] = milestone.description
+
+    ## milestones from get_course_milestones already have their ms timestamps
+    if hasattr(milestone, "start_date_time_ms"):
+        data[START_DATE_TIME] = milestone.start_date_time_ms
+        data[END_DATE_TIME] = milestone.end_date_time_ms
+    else:
+        data[START_DATE_TIME] = parse_datetime_to_ms_timestamp(
+            milestone.start_date_time
+        )
+        data[END_DATE_TIME] = parse_datetime_to_ms_timestamp(milestone.end_date_time)
+
+    data[IS_PUBLISHED] = milestone.is_published
 
     return data
 
 
-def course_membership_to_json(membership: CourseMembership) -> dict:
+def course_membership_to_json(
+    membership: CourseMembership, user_cache: Optional[dict[int, dict]] = None
+) -> dict:
     data = to_base_json(membership)
 
     data |= {
-        USER: user_to_json(membership.user),
+        USER: cached_user_to_json(membership.user, user_cache),
         ROLE: membership.role,
     }
 
@@ -177,17 +442,26 @@ def course_membership_to_json(membership: CourseMembership) -> dict:
 def course_group_to_json(group: CourseGroup) -> dict:
     data = to_base_json(group)
 
-    data |= {NAME: group.name, MEMBER_COUNT: group.coursegroupmember_set.count()}
+    ## groups from get_course_submission_viewable_groups already have their member count
+    member_count = (
+        group.member_count
+        if hasattr(group, "member_count")
+        else group.coursegroupmember_set.count()
+    )
+
+    data |= {NAME: group.name, MEMBER_COUNT: member_count}
 
     return data
 
 
-def course_group_with_members_to_json(group: CourseGroup) -> dict:
+def course_group_with_members_to_json(
+    group: CourseGroup, user_cache: Optional[dict[int, dict]] = None
+) -> dict:
     data = course_group_to_json(group=group)
 
     data |= {
         MEMBERS: [
-            user_to_json(group_member.member.user)
+            cached_user_to_json(group_member.member.user, user_cache)
             for group_member in group.coursegroupmember_set.all()
         ],
     }
@@ -209,7 +483,24 @@ def course_milestone_template_to_json(template: CourseMilestoneTemplate) -> dict
     return data
 
 
-def course_submission_summary_to_json(submission: CourseSubmission) -> dict:
+def get_course_submission_visibility(
+    submission: CourseSubmission,
+) -> VisibilityStatus:
+    ## annotated by get_requested_course_submissions for submission lists
+    has_viewable_groups = (
+        submission.has_viewable_groups
+        if hasattr(submission, "has_viewable_groups")
+        else submission.coursesubmissionviewablegroup_set.exists()
+    )
+
+    return (
+        VisibilityStatus.PUBLISHED if has_viewable_groups else VisibilityStatus.PRIVATE
+    )
+
+
+def course_submission_summary_to_json(
+    submission: CourseSubmission, user_cache: Optional[dict[int, dict]] = None
+) -> dict:
     data = to_base_json(submission)
 
     data |= {
@@ -217,10 +508,10 @@ def course_submission_summary_to_json(submission: CourseSubmission) -> dict:
         DESCRIPTION: submission.description,
         IS_DRAFT: submission.is_draft,
         SUBMISSION_TYPE: submission.submission_type,
-        CREATOR: user_to_json(submission.creator.user)
+        CREATOR: cached_user_to_json(submission.creator.user, user_cache)
         if submission.creator is not None
         else None,
-        EDITOR: user_to_json(submission.editor.user)
+        EDITOR: cached_user_to_json(submission.editor.user, user_cache)
         if submission.editor is not None
         else None,
         MILESTONE: {ID: submission.milestone.id, NAME: submission.milestone.name}
@@ -229,19 +520,19 @@ def course_submission_summary_to_json(submission: CourseSubmission) -> dict:
         GROUP: {ID: submission.group.id, NAME: submission.group.name}
         if submission.group is not None
         else None,
-        VISIBILITY: VisibilityStatus.PUBLISHED 
-        if submission.coursesubmissionviewablegroup_set.count() > 0
-        else VisibilityStatus.PRIVATE,
+        VISIBILITY: get_course_submission_visibility(submission),
     }
 
     return data
 
 
-def comment_to_json(comment: Comment) -> dict:
+def comment_to_json(
+    comment: Comment, user_cache: Optional[dict[int, dict]] = None
+) -> dict:
     data = to_base_json(comment)
 
     data |= {
-        COMMENTER: user_to_json(comment.commenter)
+        COMMENTER: cached_user_to_json(comment.commenter, user_cache)
         if comment.commenter is not None
         else None,
         CONTENT: "" if comment.is_deleted else comment.content,
@@ -253,8 +544,9 @@ def comment_to_json(comment: Comment) -> dict:
 
 def course_submission_comment_to_json(
     submission_comment: CourseSubmissionComment,
+    user_cache: Optional[dict[int, dict]] = None,
 ) -> dict:
-    data = comment_to_json(submission_comment.comment)
+    data = comment_to_json(submission_comment.comment, user_cache)
 
     data |= {
         FIELD_INDEX: submission_comment.field_index,
@@ -269,25 +561,29 @@ def course_submission_comment_to_json(
 
 
 def course_submission_to_json(
-    submission: CourseSubmission, with_comments: bool = False
+    submission: CourseSubmission,
+    with_comments: bool = False,
+    user_cache: Optional[dict[int, dict]] = None,
 ) -> dict:
-    data = course_submission_summary_to_json(submission)
+    ## commenters of the same submission are usually the same few members
+    if user_cache is None:
+        user_cache = {}
+
+    data = course_submission_summary_to_json(submission, user_cache)
 
     data |= {
         TEMPLATE: course_milestone_template_to_json(submission.template)
         if submission.template is not None
         else None,
         FORM_RESPONSE_DATA: submission.form_response_data,
-        VISIBILITY: VisibilityStatus.PUBLISHED 
-        if submission.coursesubmissionviewablegroup_set.count() > 0
-        else VisibilityStatus.PRIVATE,
     }
 
     if with_comments:
         comments = get_course_submission_comments(submission)
         data |= {
             COMMENTS: [
-                course_submission_comment_to_json(comment) for comment in comments
+                course_submission_comment_to_json(comment, user_cache)
+                for comment in comments
             ]
         }
 
@@ -326,7 +622,7 @@ def create_course(
         allow_students_to_leave_groups=allow_students_to_leave_groups,
         allow_students_to_modify_group_name=allow_students_to_modify_group_name,
         allow_students_to_add_or_remove_group_members=allow_students_to_add_or_remove_group_members,
-        milestone_alias=milestone_alias.lower(),
+        milestone_alias=milestone_alias,
     )
 
     ## IMPORTANT!! make owner as course member
@@ -337,10 +633,59 @@ def create_course(
     return new_course, new_member
 
 
+@transaction.atomic
+def create_courses_bulk(
+    owner: User, rows: Sequence[dict]
+) -> list[tuple[Course, CourseMembership]]:
+    ## each row takes the same keyword arguments as create_course (except owner)
+    new_courses = Course.objects.bulk_create(
+        Course(
+            owner=owner,
+            name=row["name"],
+            description=row["description"],
+            is_published=row["is_published"],
+        )
+        for row in rows
+    )
+
+    ## create course settings
+    new_course_settings = [
+        CourseSettings(
+            course=new_course,
+            show_group_members_names=row["show_group_members_names"],
+            allow_students_to_create_groups=row["allow_students_to_create_groups"],
+            allow_students_to_delete_groups=row["allow_students_to_delete_groups"],
+            allow_students_to_join_groups=row["allow_students_to_join_groups"],
+            allow_students_to_leave_groups=row["allow_students_to_leave_groups"],
+            allow_students_to_modify_group_name=row[
+                "allow_students_to_modify_group_name"
+            ],
+            allow_students_to_add_or_remove_group_members=row[
+                "allow_students_to_add_or_remove_group_members"
+            ],
+            milestone_alias=row["milestone_alias"],
+        )
+        for new_course, row in zip(new_courses, rows)
+    ]
+
+    ## bulk_create does not call save
+    for course_settings in new_course_settings:
+        course_settings.normalize()
+
+    CourseSettings.objects.bulk_create(new_course_settings)
+
+    ## IMPORTANT!! make owner as course member
+    new_members = CourseMembership.objects.bulk_create(
+        CourseMembership(user=owner, course=new_course, role=Role.CO_OWNER)
+        for new_course in new_courses
+    )
+
+    return list(zip(new_courses, new_members))
+
+
 @transaction.atomic
 def update_course(
     course: Course,
-    owner_id: Optional[int],
     name: str,
     description: str,
     is_published: bool,
@@ -352,11 +697,12 @@ def update_course(
     allow_students_to_modify_group_name: bool,
     allow_students_to_add_or_remove_group_members: bool,
     milestone_alias: str,
+    owner_id: Optional[int] = None,
 ) -> Course:
     try:
         owner_membership = (
             None
-            if owner_id is None or owner_id == course.owner.id
+            if owner_id is None or owner_id == course.owner_id
             else course.coursemembership_set.select_related("user__profile_image").get(
                 user_id=owner_id
             )
@@ -365,33 +711,33 @@ def update_course(
         logger.warning(e)
         raise ValueError("New owner is not in this course.")
 
+    course_field_values = {
+        "name": name,
+        "description": description,
+        "is_published": is_published,
+    }
+
     if owner_membership is not None:
-        course.owner = owner_membership.user
+        course_field_values["owner"] = owner_membership.user
 
         ## make new owner co-owner role
-        if owner_membership.role != Role.CO_OWNER:
-            owner_membership.role = Role.CO_OWNER
-            owner_membership.save()
+        CourseMembership.objects.filter(id=owner_membership.id).exclude(
+            role=Role.CO_OWNER
+        ).update(role=Role.CO_OWNER, updated_at=timezone_now())
 
-    course.name = name
-    course.description = description
-    course.is_published = is_published
-    course.save()
+    course.save_changed_fields(**course_field_values)
 
     course_settings: CourseSettings = course.coursesettings
-    course_settings.show_group_members_names = show_group_members_names
-    course_settings.allow_students_to_create_groups = allow_students_to_create_groups
-    course_settings.allow_students_to_delete_groups = allow_students_to_delete_groups
-    course_settings.allow_students_to_join_groups = allow_students_to_join_groups
-    course_settings.allow_students_to_leave_groups = allow_students_to_leave_groups
-    course_settings.allow_students_to_modify_group_name = (
-        allow_students_to_modify_group_name
-    )
-    course_settings.allow_students_to_add_or_remove_group_members = (
-        allow_students_to_add_or_remove_group_members
+    course_settings.save_changed_fields(
+        show_group_members_names=show_group_members_names,
+        allow_students_to_create_groups=allow_students_to_create_groups,
+        allow_students_to_delete_groups=allow_students_to_delete_groups,
+        allow_students_to_join_groups=allow_students_to_join_groups,
+        allow_students_to_leave_groups=allow_students_to_leave_groups,
+        allow_students_to_modify_group_name=allow_students_to_modify_group_name,
+        allow_students_to_add_or_remove_group_members=allow_students_to_add_or_remove_group_members,
+        milestone_alias=milestone_alias,
     )
-    course_settings.milestone_alias = milestone_alias.lower()
-    course_settings.save()
 
     return course
 
@@ -438,7 +784,14 @@ def update_course_milestone(
     milestone.end_date_time = end_date_time
     milestone.is_published = is_published
 
-    milestone.save()
+    ## start < end is already checked by the serializer before it reaches the database
+    try:
+        milestone.save()
+    except IntegrityError as e:
+        logger.warning(e)
+        raise ValueError(
+            f"Another {milestone.course.coursesettings.milestone_alias or MILESTONE} with the same name already exists in this course."
+        )
 
     return milestone
 
@@ -511,8 +864,16 @@ def is_group_member(
     if force_query_db:
         return group.coursegroupmember_set.filter(member=membership).exists()
 
+    ## groups listed by CourseGroupsView are annotated for the requester
+    if hasattr(group, "is_mine"):
+        return group.is_mine
+
+    ## only walk the members if they were already prefetched
+    if "coursegroupmember_set" not in getattr(group, "_prefetched_objects_cache", {}):
+        return group.coursegroupmember_set.filter(member=membership).exists()
+
     return any(
-        group_member.member == membership
+        group_member.member_id == membership.id
         for group_member in group.coursegroupmember_set.all()
     )
 
@@ -870,6 +1231,38 @@ def can_view_course_submission(
     )
 
 
+def filter_viewable_course_submissions(
+    requester_membership: CourseMembership,
+    submissions: QuerySet[CourseSubmission],
+) -> QuerySet[CourseSubmission]:
+    ## same rules as can_view_course_submission, resolved in a single query
+    if requester_membership.role != Role.STUDENT:
+        return submissions
+
+    requester_group_ids = CourseGroupMember.objects.filter(
+        member=requester_membership
+    ).values("group_id")
+
+    return submissions.filter(
+        Q(creator=requester_membership)
+        | Q(group_id__in=requester_group_ids)
+        | Q(
+            Exists(
+                CourseSubmissionViewableMember.objects.filter(
+                    submission=OuterRef("pk"), member=requester_membership
+                )
+            )
+        )
+        | Q(
+            Exists(
+                CourseSubmissionViewableGroup.objects.filter(
+                    submission=OuterRef("pk"), group_id__in=requester_group_ids
+                )
+            )
+        )
+    )
+
+
 def can_update_course_submission(
     requester_membership: CourseMembership, submission: CourseSubmission
 ) -> bool:
@@ -947,35 +1340,25 @@ def delete_course_submission_comment(
 @transaction.atomic
 def batch_update_course_submission_viewable_groups(
     course: Course, submission: CourseSubmission, group_ids: Sequence[int]
-) -> CourseSubmission:
+) -> QuerySet[CourseGroup]:
+    group_ids = set(group_ids)
+
+    # check that all groups are in the course before changing anything
+    if course.coursegroup_set.filter(id__in=group_ids).count() != len(group_ids):
+        raise ValueError("One or more of the groups are not a part of this course.")
 
     # delete viewable groups whose ids are not in list of ids
-    viewable_groups_to_delete = CourseSubmissionViewableGroup.objects.filter(submission=submission).exclude(
-        group__id__in=group_ids
+    CourseSubmissionViewableGroup.objects.filter(submission=submission).exclude(
+        group_id__in=group_ids
+    ).delete()
+
+    # add groups that are not viewable yet, leaving existing ones untouched
+    CourseSubmissionViewableGroup.objects.bulk_create(
+        (
+            CourseSubmissionViewableGroup(submission=submission, group_id=group_id)
+            for group_id in group_ids
+        ),
+        ignore_conflicts=True,
     )
-    _, _ = viewable_groups_to_delete.delete()
-
-    # add groups that have no viewable groups yet
-    for group_id in group_ids:
-        try:
-            group = course.coursegroup_set.get(id=group_id)
-
-            if CourseSubmissionViewableGroup.objects.filter(
-                submission=submission, group__id=group_id
-            ).exists():
-                continue
-
-            CourseSubmissionViewableGroup.objects.create(submission=submission, group=group)
-        except CourseGroup.DoesNotExist as e:
-            logger.warning(e)
-            raise ValueError(
-                "One or more of the groups are not a part of this course."
-            )
-        except IntegrityError as e:
-            logger.warning(e)
-            raise ValueError("Unable to publish the submission to a group.")
-
-    updated_viewable_groups = submission.coursesubmissionviewablegroup_set \
-        .prefetch_related('group').all()
 
-    return updated_viewable_groups
+    return get_course_submission_viewable_groups(submission)
@@ -1,12 +1,14 @@
 import logging
+from typing import Optional, Sequence
 
 from django.db.models import Prefetch
 
 from rest_framework.exceptions import NotFound, PermissionDenied
 
 from pigeonhole.common.constants import MILESTONE
-from users.models import User
-from .logic import get_courses
+from users.middlewares import get_requester
+from users.models import AccountType, User
+from .logic import get_courses, get_course_memberships_with_course
 from .models import (
     Course,
     CourseGroup,
@@ -22,18 +24,74 @@ from .models import (
 logger = logging.getLogger("main")
 
 
-def check_course(view_method):
-    def _arguments_wrapper(instance, request, course_id: int, *args, **kwargs):
-        try:
-            course = (
-                get_courses(id=course_id)
-                .select_related("owner__profile_image", "coursesettings")
-                .get()
+def _get_course_and_requester_membership(
+    request, course_id: int
+) -> tuple[Course, Optional[CourseMembership]]:
+    ## fetch the requester's membership together with the course
+    ## so that the membership check does not query again
+    try:
+        requester_membership = get_course_memberships_with_course(
+            course_id=course_id, user_id=request.user.id
+        ).get()
+
+        return requester_membership.course, requester_membership
+
+    except CourseMembership.DoesNotExist:
+        pass
+
+    try:
+        return get_courses(id=course_id).get(), None
+
+    except Course.DoesNotExist as e:
+        logger.warning(e)
+        raise NotFound(detail="No course found.")
+
+
+def _check_requester_role(
+    requester: User,
+    course: Course,
+    requester_membership: Optional[CourseMembership],
+    allowed_roles: Sequence[Role],
+) -> CourseMembership:
+    if requester_membership is None:
+        logger.warning(f"User {requester.id} is not in course {course.id}.")
+        raise PermissionDenied()
+
+    if requester_membership.role not in allowed_roles:
+        raise PermissionDenied()
+
+    requester_membership.user = requester
+
+    return requester_membership
+
+
+def _get_submission(
+    course: Course, submission_id: int, deferred_fields: Sequence[str] = ()
+) -> CourseSubmission:
+    try:
+        return (
+            course.coursesubmission_set.select_related(
+                "milestone",
+                "group",
+                "template__form",
+                "creator__user__profile_image",
+                "editor__user__profile_image",
             )
+            .defer(*deferred_fields)
+            .get(id=submission_id)
+        )
+
+    except CourseSubmission.DoesNotExist as e:
+        logger.warning(e)
+        raise NotFound(detail="No submission found.")
 
-        except Course.DoesNotExist as e:
-            logger.warning(e)
-            raise NotFound(detail="No course found.")
+
+def check_course(view_method):
+    def _arguments_wrapper(instance, request, course_id: int, *args, **kwargs):
+        course, requester_membership = _get_course_and_requester_membership(
+            request, course_id
+        )
+        request.requester_membership = requester_membership
 
         return view_method(instance, request, course=course, *args, **kwargs)
 
@@ -45,17 +103,10 @@ def check_requester_membership(*allowed_roles: Role):
         def _arguments_wrapper(
             instance, request, requester: User, course: Course, *args, **kwargs
         ):
-            try:
-                requester_membership = course.coursemembership_set.get(user=requester)
-
-            except CourseMembership.DoesNotExist as e:
-                logger.warning(e)
-                raise PermissionDenied()
-
-            if requester_membership.role not in allowed_roles:
-                raise PermissionDenied()
-
-            requester_membership.user = requester
+            ## already fetched by check_course
+            requester_membership = _check_requester_role(
+                requester, course, request.requester_membership, allowed_roles
+            )
 
             return view_method(
                 instance,
@@ -157,28 +208,40 @@ def check_template(view_method):
     return _arguments_wrapper
 
 
-def check_submission(view_method):
-    def _arguments_wrapper(
-        instance, request, submission_id: int, course: Course, *args, **kwargs
-    ):
-        try:
-            submission = course.coursesubmission_set.select_related(
-                "milestone",
-                "group",
-                "template__form",
-                "creator__user__profile_image",
-                "editor__user__profile_image",
-            ).get(id=submission_id)
+def check_submission_access(
+    account_types: Sequence[AccountType],
+    roles: Sequence[Role],
+    deferred_fields: Sequence[str] = (),
+):
+    ## account, course, membership and submission checks in a single wrapper
+    ## deferred_fields are not loaded for views that do not read them
+    def _method_wrapper(view_method):
+        def _arguments_wrapper(
+            instance, request, course_id: int, submission_id: int, *args, **kwargs
+        ):
+            requester = get_requester(request, *account_types)
+            course, requester_membership = _get_course_and_requester_membership(
+                request, course_id
+            )
+            requester_membership = _check_requester_role(
+                requester, course, requester_membership, roles
+            )
+            submission = _get_submission(course, submission_id, deferred_fields)
 
-        except CourseSubmission.DoesNotExist as e:
-            logger.warning(e)
-            raise NotFound(detail="No submission found.")
+            return view_method(
+                instance,
+                request,
+                requester=requester,
+                course=course,
+                requester_membership=requester_membership,
+                submission=submission,
+                *args,
+                **kwargs,
+            )
 
-        return view_method(
-            instance, request, course=course, submission=submission, *args, **kwargs
-        )
+        return _arguments_wrapper
 
-    return _arguments_wrapper
+    return _method_wrapper
 
 
 def check_submission_comment(view_method):
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.5 on 2026-10-15 04:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_coursesubmissionviewablemember_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['owner', 'is_published'], name='course_owner_published_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.5 on 2026-10-15 04:10
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_course_course_owner_published_idx'),
+    ]
+
+    operations = [
+        ## aliases saved through the admin may not be lowercase yet
+        migrations.RunSQL(
+            sql='UPDATE courses_coursesettings SET milestone_alias = LOWER(milestone_alias) WHERE milestone_alias <> LOWER(milestone_alias)',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='coursesettings',
+            constraint=models.CheckConstraint(check=models.Q(('milestone_alias', django.db.models.functions.text.Lower('milestone_alias'))), name='course_settings_milestone_alias_lowercase'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.5 on 2026-10-15 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_coursesettings_course_settings_milestone_alias_lowercase'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coursemilestone',
+            index=models.Index(fields=['course', 'is_published', 'start_date_time'], name='course_milestone_listing_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.5 on 2026-10-15 08:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_coursemilestone_course_milestone_listing_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursesubmission',
+            name='form_response_data_len',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        ## count in the database instead of loading every form response
+        migrations.RunSQL(
+            sql="UPDATE courses_coursesubmission SET form_response_data_len = jsonb_array_length(form_response_data) WHERE jsonb_typeof(form_response_data) = 'array'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.db.models.signals import post_delete
 
 from pigeonhole.common.utils import default_list
@@ -38,6 +39,13 @@ class Course(TimestampedModel):
     description = models.TextField(blank=True)
     is_published = models.BooleanField()
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["owner", "is_published"], name="course_owner_published_idx"
+            )
+        ]
+
     def __str__(self) -> str:
         return f"{self.name} | {self.owner}"
 
@@ -57,6 +65,22 @@ class CourseSettings(TimestampedModel):
 
     class Meta:
         verbose_name_plural = "course settings"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(milestone_alias=Lower("milestone_alias")),
+                name="course_settings_milestone_alias_lowercase",
+            ),
+        ]
+
+    def normalize(self):
+        ## the only place the alias is normalized, called by save and bulk creation
+        ## the check constraint catches writes that skip both
+        self.milestone_alias = self.milestone_alias.lower()
+
+    def save(self, *args, **kwargs):
+        self.normalize()
+
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"{self.course}"
@@ -131,6 +155,12 @@ class CourseMilestone(TimestampedModel):
                 name="course_milestone_start_date_time_lt_end_date_time",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["course", "is_published", "start_date_time"],
+                name="course_milestone_listing_idx",
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} | {self.course.name}"
@@ -195,6 +225,22 @@ class CourseSubmission(TimestampedModel):
         max_length=MAX_SUBMISSION_TYPE_LENGTH, choices=SubmissionType.choices
     )
     form_response_data = models.JSONField(blank=True, default=default_list)
+    ## number of fields in form_response_data, so it can be read without the json
+    form_response_data_len = models.PositiveIntegerField(default=0)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+
+        ## form_response_data may be deferred when it is not being saved
+        if update_fields is None:
+            if "form_response_data" not in self.get_deferred_fields():
+                self.form_response_data_len = len(self.form_response_data)
+
+        elif "form_response_data" in update_fields:
+            self.form_response_data_len = len(self.form_response_data)
+            kwargs["update_fields"] = [*update_fields, "form_response_data_len"]
+
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"{self.name} | {self.creator}"
@@ -1,10 +1,13 @@
+from collections import defaultdict
+
 from rest_framework import serializers
 
-from pigeonhole.common.models import MergeSerializersMixin
+from pigeonhole.common.models import CachedFieldsSerializerMixin, MergeSerializersMixin
 from pigeonhole.common.serializers import (
     NameSerializer,
     UserIdSerializer,
     IdField,
+    MsTimestampDateTimeField,
     ObjectListField,
     BatchUserIdSerializer,
 )
@@ -23,8 +26,14 @@ from .models import (
     Comment,
 )
 
+## tuples are not copied when DRF deep copies the declared fields per instance
+ROLE_CHOICES = tuple(Role.choices)
+PATCH_COURSE_GROUP_ACTION_CHOICES = tuple(PatchCourseGroupAction.choices)
+
 
-class CourseSettingsSerializer(serializers.ModelSerializer):
+class CourseSettingsSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     ## need to override auto-generated one to make it required
     milestone_alias = serializers.CharField(
         required=True, max_length=255, allow_blank=True
@@ -44,7 +53,9 @@ class CourseSettingsSerializer(serializers.ModelSerializer):
         )
 
 
-class PostCourseSerializer(MergeSerializersMixin, serializers.ModelSerializer):
+class PostCourseSerializer(
+    CachedFieldsSerializerMixin, MergeSerializersMixin, serializers.ModelSerializer
+):
     ## need to override auto-generated one to make it required
     description = serializers.CharField(required=True, allow_blank=True)
 
@@ -61,17 +72,22 @@ class PutCourseSerializer(PostCourseSerializer):
         fields = PostCourseSerializer.Meta.fields + ("owner_id",)
 
 
-class PostCourseMilestoneSerializer(serializers.ModelSerializer):
+class BatchPostCourseSerializer(serializers.Serializer):
+    courses = PostCourseSerializer(many=True, allow_empty=False)
+
+
+class PostCourseMilestoneSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     ## need to override auto-generated one to make it required
     description = serializers.CharField(required=True, allow_blank=True)
-    start_date_time = serializers.IntegerField(required=True, min_value=0)
-    end_date_time = serializers.IntegerField(
-        required=True, allow_null=True, min_value=0
-    )
+    start_date_time = MsTimestampDateTimeField(required=True)
+    end_date_time = MsTimestampDateTimeField(required=True, allow_null=True)
 
     def validate(self, data):
         """
         Check that start_date_time is before end_date_time.
+        Also enforced by a database constraint, this gives an early 400 instead.
         """
         start_date_time = data["start_date_time"]
         end_date_time = data["end_date_time"]
@@ -97,19 +113,23 @@ class PostCourseMilestoneSerializer(serializers.ModelSerializer):
 PutCourseMilestoneSerializer = PostCourseMilestoneSerializer
 
 
-class PostCourseMembershipSerializer(serializers.ModelSerializer):
+class PostCourseMembershipSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     user_id = IdField(required=True)
     ## need to override auto-generated one to make it required
-    role = serializers.ChoiceField(required=True, choices=Role.choices)
+    role = serializers.ChoiceField(required=True, choices=ROLE_CHOICES)
 
     class Meta:
         model = CourseMembership
         fields = ("role",)
 
 
-class PatchCourseMembershipSerializer(serializers.ModelSerializer):
+class PatchCourseMembershipSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     ## need to override auto-generated one to make it required
-    role = serializers.ChoiceField(required=True, choices=Role.choices)
+    role = serializers.ChoiceField(required=True, choices=ROLE_CHOICES)
 
     class Meta:
         model = CourseMembership
@@ -120,18 +140,31 @@ class GetCourseGroupSerializer(serializers.Serializer):
     me = serializers.BooleanField(required=False, default=False)
 
 
-class PostCourseGroupSerializer(serializers.ModelSerializer):
+class PostCourseGroupSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = CourseGroup
         fields = ("name",)
 
 
-class PatchCourseGroupSerializer(serializers.Serializer):
+## actions not in this map (JOIN, LEAVE) have no payload to check
+PATCH_COURSE_GROUP_PAYLOAD_SERIALIZERS = {
+    PatchCourseGroupAction.MODIFY: NameSerializer,
+    PatchCourseGroupAction.ADD: UserIdSerializer,
+    PatchCourseGroupAction.REMOVE: UserIdSerializer,
+    PatchCourseGroupAction.UPDATE_MEMBERS: BatchUserIdSerializer,
+}
+
+
+class PatchCourseGroupActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(
-        required=True, choices=PatchCourseGroupAction.choices
+        required=True, choices=PATCH_COURSE_GROUP_ACTION_CHOICES
     )
     payload = serializers.JSONField(required=True, allow_null=True)
 
+
+class PatchCourseGroupSerializer(PatchCourseGroupActionSerializer):
     def validate(self, data):
         """
         Check the payload according to action
@@ -139,22 +172,39 @@ class PatchCourseGroupSerializer(serializers.Serializer):
         action = data["action"]
         payload = data["payload"]
 
-        match action:
-            case PatchCourseGroupAction.MODIFY:
-                serializer = NameSerializer(data=payload)
-                serializer.is_valid(raise_exception=True)
-            case PatchCourseGroupAction.ADD | PatchCourseGroupAction.REMOVE:
-                serializer = UserIdSerializer(data=payload)
-                serializer.is_valid(raise_exception=True)
-            case PatchCourseGroupAction.UPDATE_MEMBERS:
-                serializer = BatchUserIdSerializer(data=payload)
+        serializer_class = PATCH_COURSE_GROUP_PAYLOAD_SERIALIZERS.get(action)
+
+        if serializer_class is not None:
+            serializer = serializer_class(data=payload)
+            serializer.is_valid(raise_exception=True)
+
+        return data
+
+
+class BatchPatchCourseGroupSerializer(serializers.Serializer):
+    actions = PatchCourseGroupActionSerializer(many=True, allow_empty=False)
+
+    def validate(self, data):
+        """
+        Check the payloads of all actions of the same type together
+        """
+        action_to_payloads = defaultdict(list)
+
+        for action_data in data["actions"]:
+            action_to_payloads[action_data["action"]].append(action_data["payload"])
+
+        for action, payloads in action_to_payloads.items():
+            serializer_class = PATCH_COURSE_GROUP_PAYLOAD_SERIALIZERS.get(action)
+
+            if serializer_class is not None:
+                serializer = serializer_class(data=payloads, many=True)
                 serializer.is_valid(raise_exception=True)
 
         return data
 
 
 class PostCourseMilestoneTemplateSerializer(
-    MergeSerializersMixin, serializers.ModelSerializer
+    CachedFieldsSerializerMixin, MergeSerializersMixin, serializers.ModelSerializer
 ):
     ## need to override auto-generated one to make it required
     description = serializers.CharField(required=True, allow_blank=True)
@@ -177,7 +227,9 @@ class GetCourseSubmissionSerializer(serializers.Serializer):
     full = serializers.BooleanField(required=False, default=False)
 
 
-class PutCourseSubmissionSerializer(serializers.ModelSerializer):
+class PutCourseSubmissionSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     group_id = IdField(required=True, allow_null=True)
     ## need to override auto-generated one to make it required
     description = serializers.CharField(required=True, allow_blank=True)
@@ -206,7 +258,9 @@ class PostCourseSubmissionSerializer(PutCourseSubmissionSerializer):
         )
 
 
-class PostCourseSubmissionCommentSerializer(serializers.ModelSerializer):
+class PostCourseSubmissionCommentSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Comment
         fields = ("content",)
@@ -223,5 +277,6 @@ class CourseMemberCreationDataSerializer(serializers.Serializer):
 class BatchMembershipCreationSerializer(serializers.Serializer):
     member_creation_data = serializers.JSONField()
 
+
 class PutCourseSubmissionViewableGroupsSerializer(serializers.Serializer):
     group_ids = serializers.ListField(child=IdField(required=True))
@@ -1,3 +1,380 @@
+import json
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.models import TokenUser
+
+from forms.models import Form
+from users.models import AccountType, User
+from .models import (
+    Comment,
+    Course,
+    CourseGroup,
+    CourseGroupMember,
+    CourseMembership,
+    CourseMilestone,
+    CourseMilestoneTemplate,
+    CourseSettings,
+    CourseSubmission,
+    CourseSubmissionComment,
+    CourseSubmissionViewableGroup,
+    Role,
+    SubmissionType,
+)
 
 # Create your tests here.
+class CourseListQueryCountTestCase(TestCase):
+    ## the number of queries must not grow with the number of courses, groups or members
+    NUM_COURSES = 3
+    NUM_GROUPS = 3
+    NUM_MEMBERS_PER_GROUP = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create(
+            email="owner@example.com", name="Owner", is_activated=True
+        )
+
+        cls.courses = []
+
+        for course_index in range(cls.NUM_COURSES):
+            course = Course.objects.create(
+                owner=cls.owner,
+                name=f"Course {course_index}",
+                description="",
+                is_published=True,
+            )
+            CourseSettings.objects.create(
+                course=course,
+                show_group_members_names=True,
+                allow_students_to_create_groups=True,
+                allow_students_to_delete_groups=True,
+                allow_students_to_join_groups=True,
+                allow_students_to_leave_groups=True,
+                allow_students_to_modify_group_name=True,
+                allow_students_to_add_or_remove_group_members=True,
+                milestone_alias="",
+            )
+            CourseMembership.objects.create(
+                user=cls.owner, course=course, role=Role.CO_OWNER
+            )
+            cls.courses.append(course)
+
+        course = cls.courses[0]
+        milestone = CourseMilestone.objects.create(
+            course=course,
+            name="Milestone",
+            description="",
+            start_date_time=timezone.now(),
+            is_published=True,
+        )
+        template = CourseMilestoneTemplate.objects.create(
+            course=course,
+            form=Form.objects.create(name="Template"),
+            description="",
+            submission_type=SubmissionType.GROUP,
+            is_published=True,
+        )
+
+        for group_index in range(cls.NUM_GROUPS):
+            group = CourseGroup.objects.create(
+                course=course, name=f"Group {group_index}"
+            )
+
+            for member_index in range(cls.NUM_MEMBERS_PER_GROUP):
+                user = User.objects.create(
+                    email=f"student{group_index}.{member_index}@example.com",
+                    name=f"Student {group_index}.{member_index}",
+                )
+                membership = CourseMembership.objects.create(
+                    user=user, course=course, role=Role.STUDENT
+                )
+                CourseGroupMember.objects.create(member=membership, group=group)
+
+            ## one submission per group, every other one published to its group
+            submission = CourseSubmission.objects.create(
+                course=course,
+                milestone=milestone,
+                group=group,
+                template=template,
+                creator=membership,
+                editor=membership,
+                name=f"Submission {group_index}",
+                is_draft=False,
+                submission_type=SubmissionType.GROUP,
+                form_response_data=[{"response": "answer"}],
+            )
+            CourseSubmissionComment.objects.create(
+                submission=submission,
+                comment=Comment.objects.create(content="Comment", commenter=user),
+                field_index=0,
+                member=membership,
+            )
+
+            if group_index % 2 == 0:
+                CourseSubmissionViewableGroup.objects.create(
+                    submission=submission, group=group
+                )
+
+    def setUp(self):
+        ## responses are cached, count the queries of a cold request
+        cache.clear()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=TokenUser({"user_id": self.owner.id}))
+
+    def test_my_courses_query_count(self):
+        ## requester, etag aggregate, memberships with courses and owners
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("my_courses"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), self.NUM_COURSES)
+
+    def test_single_course_query_count(self):
+        ## requester, membership with course, owner and settings
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("single_course", kwargs={"course_id": self.courses[0].id})
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_course_groups_query_count(self):
+        ## requester, membership with course, groups, group members
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("course_groups", kwargs={"course_id": self.courses[0].id})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), self.NUM_GROUPS)
+
+    def test_course_submissions_query_count(self):
+        url = reverse("course_submissions", kwargs={"course_id": self.courses[0].id})
+
+        ## requester, membership with course, submissions
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+            ## the list is streamed, so its queries run while the body is read
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(content)), self.NUM_GROUPS)
+
+        ## the full list also prefetches the comments
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {"full": "true"})
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(content)), self.NUM_GROUPS)
+
+
+class SingleCourseGroupBatchViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create(email="owner@example.com", name="Owner")
+        cls.course = Course.objects.create(
+            owner=cls.owner, name="Course", description="", is_published=True
+        )
+        ## students cannot change groups, so only the owner's batches go through
+        CourseSettings.objects.create(
+            course=cls.course,
+            show_group_members_names=True,
+            allow_students_to_create_groups=False,
+            allow_students_to_delete_groups=False,
+            allow_students_to_join_groups=False,
+            allow_students_to_leave_groups=False,
+            allow_students_to_modify_group_name=False,
+            allow_students_to_add_or_remove_group_members=False,
+            milestone_alias="",
+        )
+        CourseMembership.objects.create(
+            user=cls.owner, course=cls.course, role=Role.CO_OWNER
+        )
+
+        cls.students = [
+            User.objects.create(email=f"student{index}@example.com")
+            for index in range(3)
+        ]
+        cls.student_memberships = [
+            CourseMembership.objects.create(
+                user=student, course=cls.course, role=Role.STUDENT
+            )
+            for student in cls.students
+        ]
+
+        cls.group = CourseGroup.objects.create(course=cls.course, name="Group")
+
+        ## the first and last students start in the group
+        for membership in (cls.student_memberships[0], cls.student_memberships[2]):
+            CourseGroupMember.objects.create(member=membership, group=cls.group)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse(
+            "single_course_group_batch",
+            kwargs={"course_id": self.course.id, "group_id": self.group.id},
+        )
+
+    def authenticate(self, user: User):
+        self.client.force_authenticate(user=TokenUser({"user_id": user.id}))
+
+    def get_group_member_user_ids(self) -> set[int]:
+        return set(
+            self.group.coursegroupmember_set.values_list("member__user_id", flat=True)
+        )
+
+    def test_batch_applies_all_actions(self):
+        self.authenticate(self.owner)
+
+        response = self.client.patch(
+            self.url,
+            {
+                "actions": [
+                    {"action": "MODIFY", "payload": {"name": "Renamed"}},
+                    {"action": "ADD", "payload": {"userId": self.students[1].id}},
+                    {"action": "REMOVE", "payload": {"userId": self.students[2].id}},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.name, "Renamed")
+        self.assertEqual(
+            self.get_group_member_user_ids(),
+            {self.students[0].id, self.students[1].id},
+        )
+
+    def test_failed_action_rolls_back_batch(self):
+        self.authenticate(self.owner)
+        member_user_ids = self.get_group_member_user_ids()
+
+        ## the user is not in the course, so ADD fails after MODIFY has run
+        outsider = User.objects.create(email="outsider@example.com")
+
+        response = self.client.patch(
+            self.url,
+            {
+                "actions": [
+                    {"action": "MODIFY", "payload": {"name": "Renamed"}},
+                    {"action": "ADD", "payload": {"userId": outsider.id}},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.name, "Group")
+        self.assertEqual(self.get_group_member_user_ids(), member_user_ids)
+
+    def test_student_without_permission_is_forbidden(self):
+        self.authenticate(self.students[0])
+
+        response = self.client.patch(
+            self.url,
+            {"actions": [{"action": "MODIFY", "payload": {"name": "Renamed"}}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.name, "Group")
+
+    def test_empty_batch_is_rejected(self):
+        self.authenticate(self.owner)
+
+        response = self.client.patch(self.url, {"actions": []}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class MyCoursesBatchViewTestCase(TestCase):
+    NUM_COURSES = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.educator = User.objects.create(
+            email="educator@example.com", account_type=AccountType.EDUCATOR
+        )
+        cls.student = User.objects.create(email="student@example.com")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("my_courses_batch")
+
+    def authenticate(self, user: User):
+        self.client.force_authenticate(user=TokenUser({"user_id": user.id}))
+
+    def get_course_data(self, index: int) -> dict:
+        return {
+            "name": f"Course {index}",
+            "description": "",
+            "isPublished": True,
+            "showGroupMembersNames": True,
+            "allowStudentsToCreateGroups": True,
+            "allowStudentsToDeleteGroups": True,
+            "allowStudentsToJoinGroups": True,
+            "allowStudentsToLeaveGroups": True,
+            "allowStudentsToModifyGroupName": True,
+            "allowStudentsToAddOrRemoveGroupMembers": True,
+            "milestoneAlias": "Sprint",
+        }
+
+    def test_batch_creates_courses_with_settings_and_owner(self):
+        self.authenticate(self.educator)
+
+        ## requester, then savepoint, one insert per table and release
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                self.url,
+                {
+                    "courses": [
+                        self.get_course_data(index)
+                        for index in range(self.NUM_COURSES)
+                    ]
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), self.NUM_COURSES)
+
+        courses = Course.objects.filter(owner=self.educator)
+        self.assertEqual(courses.count(), self.NUM_COURSES)
+
+        for course in courses.select_related("coursesettings"):
+            ## bulk creation skips save, the alias must still be normalized
+            self.assertEqual(course.coursesettings.milestone_alias, "sprint")
+            self.assertTrue(
+                course.coursemembership_set.filter(
+                    user=self.educator, role=Role.CO_OWNER
+                ).exists()
+            )
+
+    def test_standard_account_is_forbidden(self):
+        self.authenticate(self.student)
+
+        response = self.client.post(
+            self.url, {"courses": [self.get_course_data(0)]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Course.objects.exists())
+
+    def test_empty_batch_is_rejected(self):
+        self.authenticate(self.educator)
+
+        response = self.client.post(self.url, {"courses": []}, format="json")
+
+        self.assertEqual(response.status_code, 400)
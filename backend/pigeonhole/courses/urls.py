@@ -3,6 +3,7 @@ from django.urls import path
 from .views import (
     CourseSubmissionViewableGroupsView,
     MyCoursesView,
+    MyCoursesBatchView,
     SingleCourseView,
     CourseMilestonesView,
     SingleCourseMilestoneView,
@@ -10,6 +11,7 @@ from .views import (
     SingleCourseMembershipView,
     CourseGroupsView,
     SingleCourseGroupView,
+    SingleCourseGroupBatchView,
     CourseMilestoneTemplatesView,
     SingleCourseMilestoneTemplateView,
     CourseSubmissionsView,
@@ -22,6 +24,7 @@ from .views import (
 
 urlpatterns = [
     path("", MyCoursesView.as_view(), name="my_courses"),
+    path("batch/", MyCoursesBatchView.as_view(), name="my_courses_batch"),
     path("<int:course_id>/", SingleCourseView.as_view(), name="single_course"),
     path(
         "<int:course_id>/milestones/",
@@ -78,6 +81,11 @@ urlpatterns = [
         SingleCourseGroupView.as_view(),
         name="single_course_group",
     ),
+    path(
+        "<int:course_id>/groups/<int:group_id>/batch/",
+        SingleCourseGroupBatchView.as_view(),
+        name="single_course_group_batch",
+    ),
     path(
         "<int:course_id>/submissions/<int:submission_id>/fields/comments/",
         CourseSubmissionFieldCommentsView.as_view(),
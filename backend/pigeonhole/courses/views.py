@@ -1,18 +1,38 @@
 import logging
-from collections import Counter
-
-from django.db.models import Q, QuerySet, Prefetch
+from itertools import chain
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Count,
+    Exists,
+    FilteredRelation,
+    OuterRef,
+    Q,
+    QuerySet,
+    Prefetch,
+)
+from django.utils.cache import get_conditional_response
 
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
 
-from pigeonhole.common.constants import ROLE
-from pigeonhole.common.parsers import parse_ms_timestamp_to_datetime
 from pigeonhole.common.exceptions import BadRequest, InternalServerError
+from pigeonhole.common.responses import (
+    json_response,
+    prefers_minimal_response,
+    streaming_json_list_response,
+)
+from users.logic import get_user_to_json_fields
 from users.middlewares import check_account_access
 from users.models import User, AccountType
+from .cache import (
+    get_course_milestones_cache_key,
+    get_my_courses_cache_key,
+    get_or_build_cached_data,
+)
 from .models import (
     Course,
     CourseGroup,
@@ -45,19 +65,29 @@ from .logic import (
     course_submission_comment_to_json,
     course_submission_summary_to_json,
     course_submission_to_json,
+    course_summaries_to_json,
     course_summary_to_json,
     course_to_json,
     course_milestone_to_json,
     create_course,
+    create_courses_bulk,
     create_course_group,
     create_course_membership,
     create_course_milestone_template,
     create_course_submission,
     create_course_submission_comment,
     delete_course_submission_comment,
+    filter_viewable_course_submissions,
+    get_course_memberships_etag,
+    get_course_memberships_json,
+    get_course_milestones_etag,
+    get_my_courses_etag,
+    get_course_milestones,
+    get_course_submission_field_comment_counts_etag,
+    get_course_submission_field_comments_json,
+    get_course_submission_viewable_groups_json,
     get_requested_course_submissions,
-    get_course_submission_comments,
-    is_group_member,
+    iterate_course_submissions_with_comments,
     update_course,
     create_course_milestone,
     update_course_group,
@@ -69,8 +99,9 @@ from .logic import (
     update_course_submission_comment,
 )
 from .serializers import (
+    BatchPostCourseSerializer,
     BatchMembershipCreationSerializer,
-    CourseMemberCreationDataSerializer,
+    BatchPatchCourseGroupSerializer,
     GetCourseGroupSerializer,
     GetCourseSubmissionSerializer,
     PatchCourseGroupSerializer,
@@ -95,32 +126,133 @@ from .middlewares import (
     check_membership,
     check_requester_membership,
     check_milestone,
-    check_submission,
+    check_submission_access,
     check_submission_comment,
     check_template,
 )
 
 logger = logging.getLogger("main")
 
+
+def _modify_course_group(
+    course: Course,
+    requester_membership: CourseMembership,
+    group: CourseGroup,
+    action: PatchCourseGroupAction,
+    payload: Optional[dict],
+) -> CourseGroup:
+    return update_course_group(group=group, name=payload["name"])
+
+
+def _update_course_group_member(
+    course: Course,
+    requester_membership: CourseMembership,
+    group: CourseGroup,
+    action: PatchCourseGroupAction,
+    payload: Optional[dict],
+) -> CourseGroup:
+    ## JOIN and LEAVE act on the requester and have no payload to read
+    return update_course_group_members(
+        course=course,
+        requester_membership=requester_membership,
+        group=group,
+        user_id=payload["user_id"]
+        if action in (PatchCourseGroupAction.ADD, PatchCourseGroupAction.REMOVE)
+        else None,
+        action=action,
+    )
+
+
+def _update_course_group_members(
+    course: Course,
+    requester_membership: CourseMembership,
+    group: CourseGroup,
+    action: PatchCourseGroupAction,
+    payload: Optional[dict],
+) -> CourseGroup:
+    return batch_update_course_group_members(
+        course=course, group=group, user_ids=payload["user_ids"]
+    )
+
+
+## keyed by the plain action strings that the serializers hand back
+## so lookups hash a str instead of going through Enum.__hash__
+PATCH_COURSE_GROUP_HANDLERS = {
+    PatchCourseGroupAction.MODIFY.value: _modify_course_group,
+    PatchCourseGroupAction.JOIN.value: _update_course_group_member,
+    PatchCourseGroupAction.LEAVE.value: _update_course_group_member,
+    PatchCourseGroupAction.ADD.value: _update_course_group_member,
+    PatchCourseGroupAction.REMOVE.value: _update_course_group_member,
+    PatchCourseGroupAction.UPDATE_MEMBERS.value: _update_course_group_members,
+}
+
+
+def _patch_course_group(
+    course: Course,
+    requester_membership: CourseMembership,
+    group: CourseGroup,
+    action: PatchCourseGroupAction,
+    payload: Optional[dict],
+) -> CourseGroup:
+    if not can_update_course_group(
+        course=course, membership=requester_membership, group=group, action=action
+    ):
+        raise PermissionDenied()
+
+    try:
+        handler = PATCH_COURSE_GROUP_HANDLERS[action]
+    except KeyError:  ## should never enter this case
+        raise InternalServerError(detail="Invalid action.")
+
+    try:
+        return handler(
+            course=course,
+            requester_membership=requester_membership,
+            group=group,
+            action=action,
+            payload=payload,
+        )
+    except ValueError as e:
+        logger.warning(e)
+        raise BadRequest(detail=e)
+
+
 # Create your views here.
 class MyCoursesView(APIView):
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     def get(self, request, requester: User):
-        ## only show courses which are published or if course membership role is above STUDENT
-        visible_memberships: QuerySet[
-            CourseMembership
-        ] = requester.coursemembership_set.filter(
-            ~Q(role=Role.STUDENT) | Q(course__is_published=True)
-        ).select_related(
-            "course__owner__profile_image"
-        )
+        etag = get_my_courses_etag(requester)
+        not_modified_response = get_conditional_response(request, etag=etag)
+
+        if not_modified_response is not None:
+            return not_modified_response
+
+        def build_data():
+            ## only show courses which are published or if course membership role is above STUDENT
+            visible_memberships: QuerySet[
+                CourseMembership
+            ] = requester.coursemembership_set.filter(
+                ~Q(role=Role.STUDENT) | Q(course__is_published=True)
+            ).select_related(
+                "course__owner__profile_image"
+            ).only(
+                ## exactly the columns read by course_summary_to_json
+                "role",
+                "course__created_at",
+                "course__updated_at",
+                "course__name",
+                "course__description",
+                "course__is_published",
+                *get_user_to_json_fields("course__owner"),
+            )
 
-        data = [
-            course_summary_to_json(course=membership.course, membership=membership)
-            for membership in visible_memberships
-        ]
+            return course_summaries_to_json(visible_memberships)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        data = get_or_build_cached_data(
+            key=get_my_courses_cache_key(requester.id, etag), builder=build_data
+        )
+
+        return Response(data=data, status=status.HTTP_200_OK, headers={"ETag": etag})
 
     @check_account_access(AccountType.EDUCATOR, AccountType.ADMIN)
     def post(self, request, requester: User):
@@ -129,38 +261,35 @@ class MyCoursesView(APIView):
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        new_course, new_membership = create_course(
-            owner=requester,
-            name=validated_data["name"],
-            description=validated_data["description"],
-            is_published=validated_data["is_published"],
-            show_group_members_names=validated_data["show_group_members_names"],
-            allow_students_to_create_groups=validated_data[
-                "allow_students_to_create_groups"
-            ],
-            allow_students_to_delete_groups=validated_data[
-                "allow_students_to_delete_groups"
-            ],
-            allow_students_to_join_groups=validated_data[
-                "allow_students_to_join_groups"
-            ],
-            allow_students_to_leave_groups=validated_data[
-                "allow_students_to_leave_groups"
-            ],
-            allow_students_to_modify_group_name=validated_data[
-                "allow_students_to_modify_group_name"
-            ],
-            allow_students_to_add_or_remove_group_members=validated_data[
-                "allow_students_to_add_or_remove_group_members"
-            ],
-            milestone_alias=validated_data["milestone_alias"],
-        )
+        ## serializer fields are named after the create_course arguments
+        new_course, new_membership = create_course(owner=requester, **validated_data)
 
         data = course_summary_to_json(course=new_course, membership=new_membership)
 
         return Response(data=data, status=status.HTTP_201_CREATED)
 
 
+class MyCoursesBatchView(APIView):
+    @check_account_access(AccountType.EDUCATOR, AccountType.ADMIN)
+    def post(self, request, requester: User):
+        serializer = BatchPostCourseSerializer(data=request.data)
+
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+
+        ## all courses are created with one insert per table
+        new_courses_and_memberships = create_courses_bulk(
+            owner=requester, rows=validated_data["courses"]
+        )
+
+        data = [
+            course_summary_to_json(course=new_course, membership=new_membership)
+            for new_course, new_membership in new_courses_and_memberships
+        ]
+
+        return Response(data=data, status=status.HTTP_201_CREATED)
+
+
 class SingleCourseView(APIView):
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     @check_course
@@ -194,37 +323,11 @@ class SingleCourseView(APIView):
         owner_id = validated_data.get("owner_id")
 
         ## only course owner can update owner
-        if owner_id is not None and course.owner != requester:
+        if owner_id is not None and course.owner_id != requester.id:
             raise PermissionDenied()
 
         try:
-            updated_course = update_course(
-                course=course,
-                owner_id=owner_id,
-                name=validated_data["name"],
-                description=validated_data["description"],
-                is_published=validated_data["is_published"],
-                show_group_members_names=validated_data["show_group_members_names"],
-                allow_students_to_create_groups=validated_data[
-                    "allow_students_to_create_groups"
-                ],
-                allow_students_to_delete_groups=validated_data[
-                    "allow_students_to_delete_groups"
-                ],
-                allow_students_to_join_groups=validated_data[
-                    "allow_students_to_join_groups"
-                ],
-                allow_students_to_leave_groups=validated_data[
-                    "allow_students_to_leave_groups"
-                ],
-                allow_students_to_modify_group_name=validated_data[
-                    "allow_students_to_modify_group_name"
-                ],
-                allow_students_to_add_or_remove_group_members=validated_data[
-                    "allow_students_to_add_or_remove_group_members"
-                ],
-                milestone_alias=validated_data["milestone_alias"],
-            )
+            updated_course = update_course(course=course, **validated_data)
         except ValueError as e:
             raise BadRequest(detail=e)
 
@@ -243,7 +346,7 @@ class SingleCourseView(APIView):
         requester_membership: CourseMembership,
     ):
         ## only course owner can delete course
-        if course.owner != requester:
+        if course.owner_id != requester.id:
             raise PermissionDenied()
 
         data = course_to_json(course=course, membership=requester_membership)
@@ -264,14 +367,32 @@ class CourseMilestonesView(APIView):
         course: Course,
         requester_membership: CourseMembership,
     ):
-        visible_milestones: QuerySet[CourseMilestone] = course.coursemilestone_set.all()
+        etag = get_course_milestones_etag(course, requester_membership.role)
+        not_modified_response = get_conditional_response(request, etag=etag)
 
-        if requester_membership.role == Role.STUDENT:
-            visible_milestones = visible_milestones.filter(is_published=True)
+        if not_modified_response is not None:
+            return not_modified_response
 
-        data = [course_milestone_to_json(milestone) for milestone in visible_milestones]
+        def build_data():
+            visible_milestones: QuerySet[CourseMilestone] = get_course_milestones(
+                course
+            )
 
-        return Response(data=data, status=status.HTTP_200_OK)
+            if requester_membership.role == Role.STUDENT:
+                visible_milestones = visible_milestones.filter(is_published=True)
+
+            return [
+                course_milestone_to_json(milestone) for milestone in visible_milestones
+            ]
+
+        data = get_or_build_cached_data(
+            key=get_course_milestones_cache_key(
+                course.id, requester_membership.role, etag
+            ),
+            builder=build_data,
+        )
+
+        return Response(data=data, status=status.HTTP_200_OK, headers={"ETag": etag})
 
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     @check_course
@@ -289,18 +410,7 @@ class CourseMilestonesView(APIView):
         validated_data = serializer.validated_data
 
         try:
-            new_milestone = create_course_milestone(
-                course=course,
-                name=validated_data["name"],
-                description=validated_data["description"],
-                start_date_time=parse_ms_timestamp_to_datetime(
-                    validated_data["start_date_time"]
-                ),
-                end_date_time=parse_ms_timestamp_to_datetime(
-                    validated_data["end_date_time"]
-                ),
-                is_published=validated_data["is_published"],
-            )
+            new_milestone = create_course_milestone(course=course, **validated_data)
         except ValueError as e:
             raise BadRequest(detail=e)
 
@@ -346,18 +456,12 @@ class SingleCourseMilestoneView(APIView):
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        updated_milestone = update_course_milestone(
-            milestone=milestone,
-            name=validated_data["name"],
-            description=validated_data["description"],
-            start_date_time=parse_ms_timestamp_to_datetime(
-                validated_data["start_date_time"]
-            ),
-            end_date_time=parse_ms_timestamp_to_datetime(
-                validated_data["end_date_time"]
-            ),
-            is_published=validated_data["is_published"],
-        )
+        try:
+            updated_milestone = update_course_milestone(
+                milestone=milestone, **validated_data
+            )
+        except ValueError as e:
+            raise BadRequest(detail=e)
 
         data = course_milestone_to_json(updated_milestone)
 
@@ -393,13 +497,15 @@ class CourseMembershipsView(APIView):
         course: Course,
         requester_membership: CourseMembership,
     ):
-        memberships: QuerySet[
-            CourseMembership
-        ] = course.coursemembership_set.select_related("user__profile_image")
+        etag = get_course_memberships_etag(course)
+        not_modified_response = get_conditional_response(request, etag=etag)
 
-        data = [course_membership_to_json(membership) for membership in memberships]
+        if not_modified_response is not None:
+            return not_modified_response
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        data = get_course_memberships_json(course)
+
+        return Response(data=data, status=status.HTTP_200_OK, headers={"ETag": etag})
 
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     @check_course
@@ -444,7 +550,7 @@ class SingleCourseMembershipView(APIView):
         membership: CourseMembership,
     ):
         ## cannot update owner membership or self update membership
-        if course.owner == membership.user or requester_membership == membership:
+        if course.owner_id == membership.user_id or requester_membership == membership:
             raise PermissionDenied()
 
         serializer = PatchCourseMembershipSerializer(data=request.data)
@@ -473,7 +579,7 @@ class SingleCourseMembershipView(APIView):
         membership: CourseMembership,
     ):
         ## cannot delete owner or self delete membership
-        if course.owner == membership.user or requester_membership == membership:
+        if course.owner_id == membership.user_id or requester_membership == membership:
             raise PermissionDenied()
 
         data = course_membership_to_json(membership)
@@ -501,26 +607,38 @@ class CourseGroupsView(APIView):
 
         ## prefetch related is used for performance optimization
         ## reference: https://betterprogramming.pub/django-select-related-and-prefetch-related-f23043fd635d
-        groups: QuerySet[CourseGroup] = course.coursegroup_set.prefetch_related(
+        groups: QuerySet[CourseGroup] = course.coursegroup_set.annotate(
+            is_mine=Exists(
+                CourseGroupMember.objects.filter(
+                    group=OuterRef("pk"), member=requester_membership
+                )
+            )
+        ).prefetch_related(
             Prefetch(
                 lookup="coursegroupmember_set",
                 queryset=CourseGroupMember.objects.select_related(
                     "member__user__profile_image"
-                ),
+                ).only("group", *get_user_to_json_fields("member__user")),
             )
         )
 
+        if should_show_only_my_groups:
+            groups = groups.filter(is_mine=True)
+
+        ## same as can_view_course_group_members, with the group independent part checked once
+        can_view_all_group_members = (
+            requester_membership.role != Role.STUDENT
+            or course.coursesettings.show_group_members_names
+        )
+
+        ## members can be in more than one group
+        user_cache = {}
+
         data = [
-            course_group_with_members_to_json(group)
-            if can_view_course_group_members(
-                course=course, membership=requester_membership, group=group
-            )
+            course_group_with_members_to_json(group, user_cache)
+            if can_view_all_group_members or group.is_mine
             else course_group_to_json(group)
             for group in groups
-            if (
-                not should_show_only_my_groups
-                or is_group_member(membership=requester_membership, group=group)
-            )
         ]
 
         return Response(data=data, status=status.HTTP_200_OK)
@@ -593,41 +711,13 @@ class SingleCourseGroupView(APIView):
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        action = validated_data["action"]
-        payload = validated_data["payload"]
-
-        if not can_update_course_group(
-            course=course, membership=requester_membership, group=group, action=action
-        ):
-            raise PermissionDenied()
-
-        match action:
-            case PatchCourseGroupAction.MODIFY:
-                updated_course = update_course_group(group=group, name=payload["name"])
-            case PatchCourseGroupAction.JOIN | PatchCourseGroupAction.LEAVE | PatchCourseGroupAction.ADD | PatchCourseGroupAction.REMOVE:
-                try:
-                    updated_course = update_course_group_members(
-                        course=course,
-                        requester_membership=requester_membership,
-                        group=group,
-                        user_id=payload["user_id"],
-                        action=action,
-                    )
-                except ValueError as e:
-                    logger.warning(e)
-                    raise BadRequest(detail=e)
-            case PatchCourseGroupAction.UPDATE_MEMBERS:
-                try:
-
-                    updated_course = batch_update_course_group_members(
-                        course=course, group=group, user_ids=payload["user_ids"]
-                    )
-
-                except ValueError as e:
-                    logger.warning(e)
-                    raise BadRequest(detail=e)
-            case _:  ## should never enter this case
-                raise InternalServerError(detail="Invalid action.")
+        updated_course = _patch_course_group(
+            course=course,
+            requester_membership=requester_membership,
+            group=group,
+            action=validated_data["action"],
+            payload=validated_data["payload"],
+        )
 
         data = course_group_with_members_to_json(updated_course)
 
@@ -657,6 +747,40 @@ class SingleCourseGroupView(APIView):
         return Response(data=data, status=status.HTTP_200_OK)
 
 
+class SingleCourseGroupBatchView(APIView):
+    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
+    @check_course
+    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
+    @check_group
+    def patch(
+        self,
+        request,
+        requester: User,
+        course: Course,
+        requester_membership: CourseMembership,
+        group: CourseGroup,
+    ):
+        serializer = BatchPatchCourseGroupSerializer(data=request.data)
+
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+
+        ## all actions either succeed or fail together
+        with transaction.atomic():
+            for action_data in validated_data["actions"]:
+                group = _patch_course_group(
+                    course=course,
+                    requester_membership=requester_membership,
+                    group=group,
+                    action=action_data["action"],
+                    payload=action_data["payload"],
+                )
+
+        data = course_group_with_members_to_json(group)
+
+        return Response(data=data, status=status.HTTP_200_OK)
+
+
 class CourseMilestoneTemplatesView(APIView):
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     @check_course
@@ -671,7 +795,16 @@ class CourseMilestoneTemplatesView(APIView):
         ## only show courses which are published or if course membership role is above STUDENT
         visible_templates: QuerySet[
             CourseMilestoneTemplate
-        ] = course.coursemilestonetemplate_set.select_related("form")
+        ] = course.coursemilestonetemplate_set.select_related("form").only(
+            ## exactly the columns read by course_milestone_template_to_json
+            "created_at",
+            "updated_at",
+            "description",
+            "submission_type",
+            "is_published",
+            "form__name",
+            "form__form_field_data",
+        )
 
         if requester_membership.role == Role.STUDENT:
             visible_templates = visible_templates.filter(is_published=True)
@@ -699,12 +832,7 @@ class CourseMilestoneTemplatesView(APIView):
         validated_data = serializer.validated_data
 
         new_template = create_course_milestone_template(
-            course=course,
-            name=validated_data["name"],
-            description=validated_data["description"],
-            submission_type=validated_data["submission_type"],
-            is_published=validated_data["is_published"],
-            form_field_data=validated_data["form_field_data"],
+            course=course, **validated_data
         )
 
         data = course_milestone_template_to_json(new_template)
@@ -752,12 +880,7 @@ class SingleCourseMilestoneTemplateView(APIView):
         validated_data = serializer.validated_data
 
         updated_template = update_course_milestone_template(
-            template=template,
-            name=validated_data["name"],
-            description=validated_data["description"],
-            submission_type=validated_data["submission_type"],
-            is_published=validated_data["is_published"],
-            form_field_data=validated_data["form_field_data"],
+            template=template, **validated_data
         )
 
         data = course_milestone_template_to_json(updated_template)
@@ -808,19 +931,33 @@ class CourseSubmissionsView(APIView):
             template_id=validated_data["template_id"],
         )
 
+        submissions = filter_viewable_course_submissions(
+            requester_membership=requester_membership, submissions=submissions
+        )
+
         full = validated_data["full"]
 
-        data = [
-            course_submission_to_json(submission=submission, with_comments=True)
+        ## the same few members create, edit and comment on most submissions
+        user_cache = {}
+
+        ## rows are fetched and encoded in chunks as the response is sent
+        data = (
+            (
+                course_submission_to_json(
+                    submission=submission, with_comments=True, user_cache=user_cache
+                )
+                for submission in iterate_course_submissions_with_comments(
+                    submissions, chunk_size=500
+                )
+            )
             if full
-            else course_submission_summary_to_json(submission)
-            for submission in submissions
-            if can_view_course_submission(
-                requester_membership=requester_membership, submission=submission
+            else (
+                course_submission_summary_to_json(submission, user_cache)
+                for submission in submissions.iterator(chunk_size=500)
             )
-        ]
+        )
 
-        return Response(data, status=status.HTTP_200_OK)
+        return streaming_json_list_response(data)
 
     @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
     @check_course
@@ -841,14 +978,7 @@ class CourseSubmissionsView(APIView):
             new_submission = create_course_submission(
                 course=course,
                 requester_membership=requester_membership,
-                milestone_id=validated_data["milestone_id"],
-                group_id=validated_data["group_id"],
-                template_id=validated_data["template_id"],
-                name=validated_data["name"],
-                description=validated_data["description"],
-                is_draft=validated_data["is_draft"],
-                submission_type=validated_data["submission_type"],
-                form_response_data=validated_data["form_response_data"],
+                **validated_data,
             )
         except ValueError as e:
             raise BadRequest(detail=e)
@@ -859,10 +989,10 @@ class CourseSubmissionsView(APIView):
 
 
 class SingleCourseSubmissionView(APIView):
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     def get(
         self,
         request,
@@ -880,10 +1010,10 @@ class SingleCourseSubmissionView(APIView):
 
         return Response(data=data, status=status.HTTP_200_OK)
 
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     def put(
         self,
         request,
@@ -907,12 +1037,7 @@ class SingleCourseSubmissionView(APIView):
                 submission=submission,
                 course=course,
                 requester_membership=requester_membership,
-                group_id=validated_data["group_id"],
-                name=validated_data["name"],
-                description=validated_data["description"],
-                is_draft=validated_data["is_draft"],
-                submission_type=validated_data["submission_type"],
-                form_response_data=validated_data["form_response_data"],
+                **validated_data,
             )
         except ValueError as e:
             raise BadRequest(detail=e)
@@ -921,10 +1046,10 @@ class SingleCourseSubmissionView(APIView):
 
         return Response(data=data, status=status.HTTP_200_OK)
 
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     def delete(
         self,
         request,
@@ -938,6 +1063,14 @@ class SingleCourseSubmissionView(APIView):
         ):
             raise PermissionDenied()
 
+        if prefers_minimal_response(request):
+            submission.delete()
+
+            return Response(
+                status=status.HTTP_204_NO_CONTENT,
+                headers={"Preference-Applied": "return=minimal"},
+            )
+
         data = course_submission_to_json(submission)
 
         submission.delete()
@@ -946,10 +1079,12 @@ class SingleCourseSubmissionView(APIView):
 
 
 class CourseSubmissionFieldCommentsView(APIView):
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+        ## only the number of fields is read
+        deferred_fields=("form_response_data",),
+    )
     def get(
         self,
         request,
@@ -963,23 +1098,35 @@ class CourseSubmissionFieldCommentsView(APIView):
         ):
             raise PermissionDenied()
 
-        field_to_comment_count_map = Counter(
-            submission.coursesubmissioncomment_set.values_list("field_index", flat=True)
+        etag = get_course_submission_field_comment_counts_etag(submission)
+        not_modified_response = get_conditional_response(request, etag=etag)
+
+        if not_modified_response is not None:
+            return not_modified_response
+
+        ## let the database count the comments of each field
+        field_to_comment_count_map = dict(
+            submission.coursesubmissioncomment_set.order_by()
+            .values("field_index")
+            .annotate(comment_count=Count("id"))
+            .values_list("field_index", "comment_count")
         )
 
         data = [
-            field_to_comment_count_map[i]
-            for i in range(len(submission.form_response_data))
+            field_to_comment_count_map.get(i, 0)
+            for i in range(submission.form_response_data_len)
         ]
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return json_response(data, headers={"ETag": etag})
 
 
 class CourseSubmissionSingleFieldCommentsView(APIView):
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+        ## only the number of fields is read
+        deferred_fields=("form_response_data",),
+    )
     def get(
         self,
         request,
@@ -994,21 +1141,21 @@ class CourseSubmissionSingleFieldCommentsView(APIView):
         ):
             raise PermissionDenied()
 
-        if field_index < 0 or field_index >= len(submission.form_response_data):
+        if not 0 <= field_index < submission.form_response_data_len:
             raise BadRequest(detail="No such field.")
 
-        comments = get_course_submission_comments(submission).filter(
-            field_index=field_index
+        data = get_course_submission_field_comments_json(
+            submission=submission, field_index=field_index
         )
 
-        data = [course_submission_comment_to_json(comment) for comment in comments]
-
-        return Response(data=data, status=status.HTTP_200_OK)
+        return json_response(data)
 
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+        ## only the number of fields is read
+        deferred_fields=("form_response_data",),
+    )
     def post(
         self,
         request,
@@ -1023,7 +1170,7 @@ class CourseSubmissionSingleFieldCommentsView(APIView):
         ):
             raise PermissionDenied()
 
-        if field_index < 0 or field_index >= len(submission.form_response_data):
+        if not 0 <= field_index < submission.form_response_data_len:
             raise BadRequest(detail="No such field.")
 
         serializer = PostCourseSubmissionCommentSerializer(data=request.data)
@@ -1045,10 +1192,10 @@ class CourseSubmissionSingleFieldCommentsView(APIView):
 
 
 class SingleCourseSubmissionCommentView(APIView):
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     @check_submission_comment
     def patch(
         self,
@@ -1083,10 +1230,10 @@ class SingleCourseSubmissionCommentView(APIView):
 
         return Response(data=data, status=status.HTTP_200_OK)
 
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.STUDENT, Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     @check_submission_comment
     def delete(
         self,
@@ -1130,51 +1277,73 @@ class CourseMembershipsWithNewUserCreationView(APIView):
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        new_members_data = list(
-            filter(lambda data: "email" in data, validated_data["member_creation_data"])
-        )
-        emails = set(map(lambda data: data["email"], new_members_data))
+        ## one entry per email, so repeated rows do not create the same user twice
+        email_to_member_data = {
+            data["email"]: data
+            for data in validated_data["member_creation_data"]
+            if "email" in data
+        }
 
-        # get users that already exist
-        existing_users = User.objects.filter(email__in=emails)
-        existing_users_emails = set(existing_users.values_list("email", flat=True))
-
-        new_users_data = [
-            user_data
-            for user_data in new_members_data
-            if user_data["email"] not in existing_users_emails
-        ]
+        ## create users and memberships together in one commit
+        try:
+            with transaction.atomic():
+                # get users that already exist, with their membership in this course
+                existing_users = list(
+                    User.objects.filter(email__in=email_to_member_data)
+                    .annotate(
+                        course_membership=FilteredRelation(
+                            "coursemembership",
+                            condition=Q(coursemembership__course=course),
+                        )
+                    )
+                    .select_related("profile_image", "course_membership")
+                )
+                existing_users_emails = {user.email for user in existing_users}
+
+                # create users that don't exist yet
+                new_users_to_be_created = (
+                    User(email=email, name=email_to_member_data[email].get("name", ""))
+                    for email in email_to_member_data.keys() - existing_users_emails
+                )
+                new_users = User.objects.bulk_create(new_users_to_be_created)
+
+                # create memberships for users that are not in the course yet
+                ## without ignore_conflicts, bulk_create returns the new ids
+                new_memberships_to_be_created = (
+                    CourseMembership(course=course, user=user)
+                    for user in chain(existing_users, new_users)
+                    if getattr(user, "course_membership", None) is None
+                )
+                new_memberships = CourseMembership.objects.bulk_create(
+                    new_memberships_to_be_created
+                )
+
+        except IntegrityError as e:
+            logger.warning(e)
+            raise BadRequest(detail="Unable to add the members to the course.")
 
-        # create users that don't exist yet
-        new_users_to_be_created = (
-            User(
-                email=user_data["email"],
-                name="" if "name" not in user_data else user_data["name"],
-            )
-            for user_data in new_users_data
-        )
-        new_users = User.objects.bulk_create(new_users_to_be_created)
+        # return all members
+        ## from the rows already in hand instead of querying the memberships again
+        existing_memberships = []
 
-        all_users = list(existing_users) + new_users
-        new_memberships_to_be_created = (
-            CourseMembership(course=course, user=user) for user in all_users
-        )
-        CourseMembership.objects.bulk_create(
-            new_memberships_to_be_created, ignore_conflicts=True
-        )
+        for user in existing_users:
+            if user.course_membership is not None:
+                user.course_membership.user = user
+                existing_memberships.append(user.course_membership)
 
-        # return all members
-        memberships = CourseMembership.objects.filter(user__email__in=emails)
-        data = [course_membership_to_json(membership) for membership in memberships]
+        data = [
+            course_membership_to_json(membership)
+            for membership in chain(existing_memberships, new_memberships)
+        ]
 
         return Response(data=data, status=status.HTTP_200_OK)
 
 
 class CourseSubmissionViewableGroupsView(APIView):
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     def get(
         self,
         request,
@@ -1183,16 +1352,14 @@ class CourseSubmissionViewableGroupsView(APIView):
         requester_membership: CourseMembership,
         submission: CourseSubmission,
     ):
-        viewable_groups: QuerySet[CourseGroup] = submission.coursesubmissionviewablegroup_set.prefetch_related('group')
+        data = get_course_submission_viewable_groups_json(submission)
 
-        data = [course_group_to_json(viewable_group.group) for viewable_group in viewable_groups]
-
-        return Response(data=data, status=status.HTTP_200_OK)
+        return json_response(data)
     
-    @check_account_access(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN)
-    @check_course
-    @check_requester_membership(Role.INSTRUCTOR, Role.CO_OWNER)
-    @check_submission
+    @check_submission_access(
+        account_types=(AccountType.STANDARD, AccountType.EDUCATOR, AccountType.ADMIN),
+        roles=(Role.INSTRUCTOR, Role.CO_OWNER),
+    )
     def put(
         self,
         request,
@@ -1213,9 +1380,6 @@ class CourseSubmissionViewableGroupsView(APIView):
         except ValueError as e:
             raise BadRequest(detail=e)
 
-        data = [
-            course_group_to_json(viewable_group.group) 
-            for viewable_group in updated_viewable_groups
-        ]
+        data = [course_group_to_json(group) for group in updated_viewable_groups]
 
         return Response(data=data, status=status.HTTP_200_OK)
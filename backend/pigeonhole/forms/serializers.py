@@ -1,11 +1,12 @@
 from rest_framework import serializers
 
+from pigeonhole.common.models import CachedFieldsSerializerMixin
 from pigeonhole.common.serializers import ObjectListField
 
 from .models import Form
 
 
-class FormSerializer(serializers.ModelSerializer):
+class FormSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     form_field_data = ObjectListField(required=True)
 
     class Meta:
@@ -1,3 +1,5 @@
+import copy
+
 from django.db import models
 
 from django_update_from_dict import UpdateFromDictMixin
@@ -10,6 +12,24 @@ class TimestampedModel(UpdateFromDictMixin, models.Model):
     class Meta:
         abstract = True
 
+    def save_changed_fields(self, **field_values) -> bool:
+        """Assigns field values and saves only the fields that changed"""
+        changed_fields = [
+            field
+            for field, value in field_values.items()
+            if getattr(self, field) != value
+        ]
+
+        if not changed_fields:
+            return False
+
+        for field in changed_fields:
+            setattr(self, field, field_values[field])
+
+        self.save(update_fields=changed_fields + ["updated_at"])
+
+        return True
+
 
 class MergeSerializersMixin:
     """Merges additional serializers"""
@@ -28,3 +48,18 @@ class MergeSerializersMixin:
             obj |= serializer.validated_data
 
         return obj
+
+
+class CachedFieldsSerializerMixin:
+    """Builds serializer fields once per class and hands each instance a copy"""
+
+    def get_fields(self):
+        serializer_class = self.__class__
+
+        ## check the class itself so that subclasses build their own fields
+        if "_cached_fields" not in serializer_class.__dict__:
+            serializer_class._cached_fields = super(
+                CachedFieldsSerializerMixin, self
+            ).get_fields()
+
+        return copy.deepcopy(serializer_class._cached_fields)
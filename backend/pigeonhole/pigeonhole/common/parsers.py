@@ -1,25 +1,49 @@
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from django.utils.timezone import get_default_timezone
+from django.db.models import BigIntegerField
+from django.db.models.functions import Cast, Extract, Floor
 
 from .constants import CREATED_AT, ID, UPDATED_AT
 from .models import TimestampedModel
 
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MS = timedelta(milliseconds=1)
+
+
 def parse_datetime_to_ms_timestamp(date_time: Optional[datetime]) -> Optional[int]:
-    return round(date_time.timestamp() * 1000) if date_time is not None else None
+    ## truncate sub-ms digits exactly, matching ms_timestamp_expression
+    return (date_time - EPOCH) // ONE_MS if date_time is not None else None
 
 
 def parse_ms_timestamp_to_datetime(ms_timestamp: Optional[int]) -> Optional[datetime]:
+    ## fixed utc offset avoids a zone lookup, the database stores utc either way
     return (
-        datetime.fromtimestamp(ms_timestamp / 1000, tz=get_default_timezone())
+        datetime.fromtimestamp(ms_timestamp / 1000, tz=timezone.utc)
         if ms_timestamp is not None
         else None
     )
 
 
+def ms_timestamp_expression(field_name: str) -> Cast:
+    ## lets the database convert a datetime column into an epoch ms timestamp
+    ## floor before the cast, which would otherwise round
+    return Cast(
+        Floor(Extract(field_name, "epoch", tzinfo=timezone.utc) * 1000),
+        output_field=BigIntegerField(),
+    )
+
+
 def to_base_json(model: TimestampedModel) -> dict:
+    ## use ms timestamps already computed by the database when annotated
+    if hasattr(model, "created_at_ms"):
+        return {
+            ID: model.id,
+            CREATED_AT: model.created_at_ms,
+            UPDATED_AT: model.updated_at_ms,
+        }
+
     return {
         ID: model.id,
         CREATED_AT: parse_datetime_to_ms_timestamp(model.created_at),
@@ -0,0 +1,56 @@
+import hashlib
+from typing import Iterable, Iterator
+
+import orjson
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.http import quote_etag
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize
+
+
+def _encode_json(data) -> bytes:
+    return orjson.dumps(camelize(data, **api_settings.JSON_UNDERSCOREIZE))
+
+
+def _encode_json_list(rows: Iterable[dict]) -> Iterator[bytes]:
+    yield b"["
+
+    for index, row in enumerate(rows):
+        if index > 0:
+            yield b","
+
+        yield _encode_json(row)
+
+    yield b"]"
+
+
+def streaming_json_list_response(rows: Iterable[dict]) -> StreamingHttpResponse:
+    ## same output as the camel case renderer without holding the whole list in memory
+    return StreamingHttpResponse(
+        _encode_json_list(rows), content_type="application/json"
+    )
+
+
+def json_response(data, status: int = 200, headers=None) -> HttpResponse:
+    ## same output as the camel case renderer, skipping content negotiation
+    return HttpResponse(
+        _encode_json(data),
+        status=status,
+        content_type="application/json",
+        headers=headers,
+    )
+
+
+def make_etag(*parts) -> str:
+    ## parts should change whenever the response body would change
+    return quote_etag(hashlib.md5(":".join(map(str, parts)).encode()).hexdigest())
+
+
+def prefers_minimal_response(request) -> bool:
+    ## Prefer: return=minimal (RFC 7240) lets clients skip the response body
+    preferences = request.META.get("HTTP_PREFER", "").split(",")
+
+    return any(
+        preference.split(";")[0].strip().lower() == "return=minimal"
+        for preference in preferences
+    )
@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from rest_framework.fields import empty
 
+from .parsers import parse_ms_timestamp_to_datetime
 from .validators import all_objects
 
 
@@ -23,6 +25,20 @@ class IdField(serializers.IntegerField):
         super().__init__(**kwargs)
 
 
+class MsTimestampDateTimeField(serializers.IntegerField):
+    """Accepts a ms timestamp and validates it into a datetime"""
+
+    def __init__(self, **kwargs):
+        if "min_value" not in kwargs:
+            kwargs["min_value"] = 0
+
+        super().__init__(**kwargs)
+
+    def run_validation(self, data=empty):
+        ## validators such as min_value still run on the integer
+        return parse_ms_timestamp_to_datetime(super().run_validation(data))
+
+
 class UserIdSerializer(serializers.Serializer):
     user_id = IdField(required=True)
 
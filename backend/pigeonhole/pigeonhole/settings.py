@@ -157,10 +157,13 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTTokenUserAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    ## browsable API is only for development, the API otherwise only serves JSON
     "DEFAULT_RENDERER_CLASSES": (
         "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
-    ),
+    )
+    if DEBUG
+    else ("djangorestframework_camel_case.render.CamelCaseJSONRenderer",),
     "DEFAULT_PARSER_CLASSES": (
         "djangorestframework_camel_case.parser.CamelCaseJSONParser",
     ),
@@ -169,6 +172,12 @@ REST_FRAMEWORK = {
     },
 }
 
+## camel case renderer delegates the actual JSON encoding to orjson
+## https://github.com/brianjbuck/drf_orjson_renderer
+JSON_CAMEL_CASE = {
+    "RENDERER_CLASS": "drf_orjson_renderer.renderers.ORJSONRenderer",
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=14) if DEBUG else timedelta(minutes=10),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=14),
@@ -189,6 +198,21 @@ DATABASES = {
     }
 }
 
+## Cache
+## https://docs.djangoproject.com/en/4.0/topics/cache/
+## shared by all workers so that a response cached by one process is reused by the others
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+    if os.getenv("REDIS_URL")
+    else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 ## Password hashers
 ## https://docs.djangoproject.com/en/4.0/topics/auth/passwords/
 
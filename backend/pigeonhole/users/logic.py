@@ -5,6 +5,9 @@ from django.db import transaction
 
 from pigeonhole.common.exceptions import InternalServerError, BadRequest
 from pigeonhole.common.constants import (
+    ID,
+    CREATED_AT,
+    UPDATED_AT,
     NAME,
     EMAIL,
     PROFILE_IMAGE,
@@ -21,10 +24,26 @@ from authentication.models import (
     FacebookAuthentication,
 )
 from content_delivery_service.models import Image
-from pigeonhole.common.parsers import to_base_json
+from pigeonhole.common.parsers import ms_timestamp_expression, to_base_json
 from .models import User, PatchUserAction
 
 
+## columns read by user_to_json, for use with QuerySet.only
+USER_TO_JSON_FIELDS = (
+    "created_at",
+    "updated_at",
+    "name",
+    "email",
+    "account_type",
+    "is_activated",
+    "profile_image__image_url",
+)
+
+
+def get_user_to_json_fields(prefix: str) -> list[str]:
+    return [f"{prefix}__{field}" for field in USER_TO_JSON_FIELDS]
+
+
 def user_to_json(user: User) -> dict:
     data = to_base_json(user)
 
@@ -41,6 +60,58 @@ def user_to_json(user: User) -> dict:
     return data
 
 
+def get_user_row_to_json_values(prefix: str) -> list[str]:
+    ## columns read by user_row_to_json, for use with QuerySet.values
+    return [
+        f"{prefix}__id",
+        *(
+            f"{prefix}__{field}"
+            for field in USER_TO_JSON_FIELDS
+            if field not in ("created_at", "updated_at")
+        ),
+    ]
+
+
+def get_user_row_to_json_annotations(prefix: str) -> dict:
+    ## ms timestamps read by user_row_to_json, for use with QuerySet.annotate
+    alias = prefix.replace("__", "_")
+
+    return {
+        f"{alias}_created_at_ms": ms_timestamp_expression(f"{prefix}__created_at"),
+        f"{alias}_updated_at_ms": ms_timestamp_expression(f"{prefix}__updated_at"),
+    }
+
+
+def user_row_to_json(row: dict, prefix: str) -> Optional[dict]:
+    ## same output as user_to_json, from a row projected with the helpers above
+    if row[f"{prefix}__id"] is None:
+        return None
+
+    alias = prefix.replace("__", "_")
+
+    return {
+        ID: row[f"{prefix}__id"],
+        CREATED_AT: row[f"{alias}_created_at_ms"],
+        UPDATED_AT: row[f"{alias}_updated_at_ms"],
+        NAME: row[f"{prefix}__name"],
+        EMAIL: row[f"{prefix}__email"],
+        PROFILE_IMAGE: row[f"{prefix}__profile_image__image_url"],
+        ACCOUNT_TYPE: row[f"{prefix}__account_type"],
+        IS_ACTIVATED: row[f"{prefix}__is_activated"],
+    }
+
+
+def cached_user_to_json(user: User, user_cache: Optional[dict[int, dict]]) -> dict:
+    ## reuse the json of users that were already serialized in the same response
+    if user_cache is None:
+        return user_to_json(user)
+
+    if user.id not in user_cache:
+        user_cache[user.id] = user_to_json(user)
+
+    return user_cache[user.id]
+
+
 def requester_to_json(requester: User) -> dict:
     data = user_to_json(user=requester)
 
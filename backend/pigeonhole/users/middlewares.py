@@ -8,22 +8,26 @@ from .logic import get_users
 logger = logging.getLogger("main")
 
 
-def check_account_access(*allowed_account_types: AccountType):
-    def _method_wrapper(view_method):
-        def _arguments_wrapper(instance, request, *args, **kwargs):
-            requester_id = request.user.id
+def get_requester(request, *allowed_account_types: AccountType) -> User:
+    requester_id = request.user.id
+
+    try:
+        requester = get_users(id=requester_id).select_related("profile_image").get()
+
+    except User.DoesNotExist as e:
+        logger.warning(e)
+        raise AuthenticationFailed(detail="Invalid user.")
 
-            try:
-                requester = (
-                    get_users(id=requester_id).select_related("profile_image").get()
-                )
+    if requester.account_type not in allowed_account_types:
+        raise PermissionDenied()
 
-            except User.DoesNotExist as e:
-                logger.warning(e)
-                raise AuthenticationFailed(detail="Invalid user.")
+    return requester
 
-            if requester.account_type not in allowed_account_types:
-                raise PermissionDenied()
+
+def check_account_access(*allowed_account_types: AccountType):
+    def _method_wrapper(view_method):
+        def _arguments_wrapper(instance, request, *args, **kwargs):
+            requester = get_requester(request, *allowed_account_types)
 
             return view_method(instance, request, requester=requester, *args, **kwargs)
 